@@ -3,8 +3,6 @@
 import os
 from typing import Optional
 
-from dotenv import load_dotenv
-
 
 class Config:
     """Configuration class that loads settings from environment variables."""
@@ -17,42 +15,61 @@ class Config:
             api_url: Optional override for API URL (from CLI arguments)
             data_folder: Optional override for data folder (from CLI arguments)
         """
+        # Imported lazily to keep module import (and CLI startup) cheap
+        from dotenv import load_dotenv
+
         if env_file:
             load_dotenv(env_file)
         else:
             load_dotenv()  # Load from .env in current directory if it exists
 
-        # Store CLI overrides
-        self._api_url_override = api_url
-        self._data_folder_override = data_folder
+        # Resolve every setting once; the environment does not change mid-run
+        # Priority: CLI override > environment variable > default
+        self._api_url = api_url or os.getenv(
+            "API_URL", "https://jsonplaceholder.typicode.com/posts"
+        )
+        self._api_timeout = int(os.getenv("API_TIMEOUT", "30"))
+        self._data_folder = data_folder or os.getenv("DATA_FOLDER", "data")
+        self._output_prefix = os.getenv("OUTPUT_PREFIX", "processed_")
+        self._log_level = os.getenv("LOG_LEVEL", "INFO")
+
+        # Output filename templates, formatted with a ``timestamp`` field;
+        # braces in the prefix are escaped so they stay literal
+        prefix = self._output_prefix.replace("{", "{{").replace("}", "}}")
+        self._raw_file_format = f"{prefix}raw_{{timestamp}}.json"
+        self._summary_file_format = f"{prefix}summary_{{timestamp}}.json"
 
     @property
     def api_url(self) -> str:
         """Get the API URL from CLI arguments, environment variables, or default."""
-        # Priority: CLI override > environment variable > default
-        if self._api_url_override:
-            return self._api_url_override
-        return os.getenv("API_URL", "https://jsonplaceholder.typicode.com/posts")
+        return self._api_url
 
     @property
     def api_timeout(self) -> int:
         """Get the API timeout in seconds."""
-        return int(os.getenv("API_TIMEOUT", "30"))
+        return self._api_timeout
 
     @property
     def data_folder(self) -> str:
         """Get the data folder path from CLI arguments, environment variables, or default."""
-        # Priority: CLI override > environment variable > default
-        if self._data_folder_override:
-            return self._data_folder_override
-        return os.getenv("DATA_FOLDER", "data")
+        return self._data_folder
 
     @property
     def output_prefix(self) -> str:
         """Get the output file prefix."""
-        return os.getenv("OUTPUT_PREFIX", "processed_")
+        return self._output_prefix
+
+    @property
+    def raw_file_format(self) -> str:
+        """Get the raw data filename template (``{timestamp}`` placeholder)."""
+        return self._raw_file_format
+
+    @property
+    def summary_file_format(self) -> str:
+        """Get the summary filename template (``{timestamp}`` placeholder)."""
+        return self._summary_file_format
 
     @property
     def log_level(self) -> str:
         """Get the log level."""
-        return os.getenv("LOG_LEVEL", "INFO")
+        return self._log_level
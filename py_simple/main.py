@@ -1,17 +1,35 @@
 """Main script for fetching and processing API data."""
 
 import argparse
-import json
 import logging
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
-
-import requests
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import orjson
 
 from .config import Config
 
+if TYPE_CHECKING:
+    import requests
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Resolved logging levels, keyed by the level name as given
+_LEVEL_CACHE: Dict[str, int] = {}
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -43,12 +61,17 @@ Examples:
 
 
 def setup_logging(log_level: str) -> logging.Logger:
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    """Set up logging configuration, replacing any previous configuration.
+
+    Uses ``basicConfig(force=True)``, which removes and closes every handler
+    already attached to the root logger, including ones installed by a host
+    application or test runner.
+    """
+    level = _LEVEL_CACHE.get(log_level)
+    if level is None:
+        level = _LEVEL_CACHE[log_level] = getattr(logging, log_level.upper())
+
+    logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=LOG_DATEFMT, force=True)
     return logging.getLogger(__name__)
 
 
@@ -59,76 +82,132 @@ def ensure_data_folder(data_folder: str) -> Path:
     return data_path
 
 
+def create_session() -> "requests.Session":
+    """Create an HTTP session with connection pooling and retries."""
+    # Imported lazily so CLI paths that never hit the network start fast
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def fetch_api_data(
-    url: str, timeout: int, logger: logging.Logger
+    url: str,
+    timeout: int,
+    logger: logging.Logger,
+    session: Optional["requests.Session"] = None,
 ) -> List[Dict[str, Any]]:
-    """Fetch data from the API."""
+    """Fetch data from the API, reusing ``session`` when one is given.
+
+    Without a ``session``, a temporary one is created and closed afterwards.
+    """
+    import requests
+
+    if session is None:
+        with create_session() as session:
+            return fetch_api_data(url, timeout, logger, session)
+
     try:
-        logger.info(f"Fetching data from: {url}")
-        response = requests.get(url, timeout=timeout)
+        logger.info("Fetching data from: %s", url)
+        response = session.get(url, timeout=timeout)
         response.raise_for_status()
 
-        data = response.json()
-        logger.info(f"Successfully fetched {len(data)} items")
+        data = orjson.loads(response.content)
+        logger.info("Successfully fetched %d items", len(data))
         return data
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch data from API: {e}")
+        logger.error("Failed to fetch data from API: %s", e)
         raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON response: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse JSON response: %s", e)
         raise
 
 
-def process_data(data: List[Dict[str, Any]], logger: logging.Logger) -> Dict[str, Any]:
-    """Process the fetched data."""
+def _aggregate_items(items: List[Dict[str, Any]]) -> Tuple[int, Dict[str, int]]:
+    """Return the total title length and per-user item counts in one pass."""
+    title_length_sum = 0
+    items_by_user: DefaultDict[str, int] = defaultdict(int)
+    for item in items:
+        title_length_sum += len(item.get("title", ""))
+        items_by_user[str(item.get("userId", "unknown"))] += 1
+    return title_length_sum, dict(items_by_user)
+
+
+def process_data(
+    data: Iterable[Dict[str, Any]],
+    logger: logging.Logger,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Process the fetched data.
+
+    ``data`` may be any iterable of items; lists are used as-is. ``now`` is
+    recorded as ``processed_at`` and defaults to the current time.
+    """
+    if now is None:
+        now = datetime.now()
+
     logger.info("Processing fetched data...")
 
+    items = data if isinstance(data, list) else list(data)
+    total_items = len(items)
+    title_length_sum, items_by_user = _aggregate_items(items)
+
+    # Every distinct user has exactly one histogram bucket
+    unique_users = len(items_by_user)
     processed = {
-        "total_items": len(data),
-        "processed_at": datetime.now().isoformat(),
+        "total_items": total_items,
+        "processed_at": now.isoformat(),
         "summary": {
-            "unique_users": len(set(item.get("userId", 0) for item in data)),
-            "average_title_length": sum(len(item.get("title", "")) for item in data)
-            / len(data)
-            if data
+            "unique_users": unique_users,
+            "average_title_length": title_length_sum / total_items
+            if total_items
             else 0,
-            "items_by_user": {},
+            "items_by_user": items_by_user,
         },
-        "items": data,
+        "items": items,
     }
 
-    # Count items by user
-    for item in data:
-        user_id = str(item.get("userId", "unknown"))
-        processed["summary"]["items_by_user"][user_id] = (
-            processed["summary"]["items_by_user"].get(user_id, 0) + 1
-        )
-
-    logger.info(
-        f"Processed {processed['total_items']} items from {processed['summary']['unique_users']} users"
-    )
+    logger.info("Processed %d items from %d users", total_items, unique_users)
     return processed
 
 
 def save_data(
-    data: Dict[str, Any], data_folder: Path, prefix: str, logger: logging.Logger
+    data: Dict[str, Any],
+    data_folder: Path,
+    raw_file_format: str,
+    summary_file_format: str,
+    logger: logging.Logger,
+    now: Optional[datetime] = None,
 ) -> None:
-    """Save processed data to files."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    """Save processed data to files timestamped with ``now`` (default: current time).
 
-    # Save raw data
-    raw_file = data_folder / f"{prefix}raw_{timestamp}.json"
-    with open(raw_file, "w", encoding="utf-8") as f:
-        json.dump(data["items"], f, indent=2, ensure_ascii=False)
-    logger.info(f"Raw data saved to: {raw_file}")
+    The file names come from the ``{timestamp}`` templates on ``Config``.
+    """
+    if now is None:
+        now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    # Save raw data as compact JSON; it is meant for machines, not people
+    raw_file = data_folder / raw_file_format.format(timestamp=timestamp)
+    raw_file.write_bytes(orjson.dumps(data["items"]))
+    logger.info("Raw data saved to: %s", raw_file)
 
     # Save processed summary
-    summary = {k: v for k, v in data.items() if k != "items"}
-    summary_file = data_folder / f"{prefix}summary_{timestamp}.json"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
-    logger.info(f"Summary saved to: {summary_file}")
+    summary = data.copy()
+    del summary["items"]
+    summary_file = data_folder / summary_file_format.format(timestamp=timestamp)
+    summary_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    logger.info("Summary saved to: %s", summary_file)
 
 
 def main() -> None:
@@ -148,19 +227,32 @@ def main() -> None:
         # Ensure data folder exists
         data_folder = ensure_data_folder(config.data_folder)
 
-        # Fetch data from API
-        raw_data = fetch_api_data(config.api_url, config.api_timeout, logger)
+        # Fetch data from API over a pooled session
+        with create_session() as session:
+            raw_data = fetch_api_data(
+                config.api_url, config.api_timeout, logger, session
+            )
+
+        # One timestamp for the run so the summary and filenames line up
+        now = datetime.now()
 
         # Process the data
-        processed_data = process_data(raw_data, logger)
+        processed_data = process_data(raw_data, logger, now)
 
         # Save the results
-        save_data(processed_data, data_folder, config.output_prefix, logger)
+        save_data(
+            processed_data,
+            data_folder,
+            config.raw_file_format,
+            config.summary_file_format,
+            logger,
+            now,
+        )
 
         logger.info("Processing completed successfully!")
 
     except Exception as e:
-        logging.error(f"Application failed: {e}")
+        logging.error("Application failed: %s", e)
         sys.exit(1)
 
 
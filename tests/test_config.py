@@ -36,6 +36,8 @@ def test_config_custom_values():
         assert config.data_folder == "custom_data"
         assert config.output_prefix == "custom_"
         assert config.log_level == "DEBUG"
+        assert config.raw_file_format == "custom_raw_{timestamp}.json"
+        assert config.summary_file_format == "custom_summary_{timestamp}.json"
 
 
 def test_config_partial_override():
@@ -50,3 +52,35 @@ def test_config_partial_override():
         assert config.data_folder == "data"  # default
         assert config.output_prefix == "processed_"  # default
         assert config.log_level == "WARNING"
+
+
+def test_config_cli_overrides():
+    """Test that CLI arguments take priority over environment variables."""
+    env = {"API_URL": "https://env.api.com/data", "DATA_FOLDER": "env_data"}
+
+    with patch.dict(os.environ, env, clear=True):
+        config = Config(api_url="https://cli.api.com/data", data_folder="cli_data")
+
+        assert config.api_url == "https://cli.api.com/data"
+        assert config.data_folder == "cli_data"
+
+
+def test_config_values_resolved_once():
+    """Test that settings are read at construction, not on each access."""
+    with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}, clear=True):
+        config = Config()
+
+    with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}, clear=True):
+        assert config.log_level == "DEBUG"
+
+
+def test_config_file_formats_with_braced_prefix():
+    """Test that braces in OUTPUT_PREFIX are kept literally in file names."""
+    with patch.dict(os.environ, {"OUTPUT_PREFIX": "run{1}_{"}, clear=True):
+        config = Config()
+
+        assert config.raw_file_format.format(timestamp="ts") == "run{1}_{raw_ts.json"
+        assert (
+            config.summary_file_format.format(timestamp="ts")
+            == "run{1}_{summary_ts.json"
+        )
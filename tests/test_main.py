@@ -1,17 +1,51 @@
 """Tests for the main module."""
 
+import json
+import logging
+from datetime import datetime
 from unittest.mock import Mock
 
-from py_simple.main import process_data, setup_logging
+import pytest
+import requests
 
+from py_simple.main import (
+    create_session,
+    fetch_api_data,
+    process_data,
+    save_data,
+    setup_logging,
+)
 
-def test_setup_logging():
+
+@pytest.fixture
+def restore_root_logger():
+    """Restore the root logger's level and handlers after the test."""
+    root = logging.getLogger()
+    level, handlers = root.level, root.handlers[:]
+    yield
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        if handler not in handlers:
+            handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def test_setup_logging(restore_root_logger):
     """Test logging setup."""
     logger = setup_logging("INFO")
     assert logger is not None
     assert logger.name == "py_simple.main"
 
 
+def test_setup_logging_reconfigures(restore_root_logger):
+    """Test that repeated setup applies the newly requested level."""
+    setup_logging("WARNING")
+    setup_logging("DEBUG")
+    assert logging.getLogger().level == logging.DEBUG
+
+
 def test_process_data():
     """Test data processing functionality."""
     # Sample data similar to JSONPlaceholder format
@@ -50,3 +84,117 @@ def test_process_data_empty():
     assert result["summary"]["unique_users"] == 0
     assert result["summary"]["average_title_length"] == 0
     assert result["items"] == []
+
+
+def test_process_data_unique_users_follow_histogram_keys():
+    """Test that users are distinguished by the string form of userId."""
+    sample_data = [
+        {"userId": 1, "title": "a"},
+        {"userId": "1", "title": "b"},
+        {"userId": 0, "title": "c"},
+        {"title": "d"},
+    ]
+
+    result = process_data(sample_data, Mock())
+
+    # 1 and "1" share a bucket; a missing userId is "unknown", not 0
+    assert result["summary"]["items_by_user"] == {"1": 2, "0": 1, "unknown": 1}
+    assert result["summary"]["unique_users"] == 3
+
+
+def test_process_data_iterable():
+    """Test data processing with a single-pass iterable of items."""
+    sample_data = [
+        {"userId": 1, "id": 1, "title": "abcd"},
+        {"userId": 2, "id": 2, "title": "ab"},
+    ]
+
+    mock_logger = Mock()
+    result = process_data(iter(sample_data), mock_logger)
+
+    assert result["total_items"] == 2
+    assert result["summary"]["unique_users"] == 2
+    assert result["summary"]["average_title_length"] == 3
+    assert result["items"] == sample_data
+
+
+def test_create_session():
+    """Test that the session mounts a pooled adapter with retries."""
+    with create_session() as session:
+        adapter = session.get_adapter("https://example.com")
+        assert adapter.max_retries.total == 3
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 10
+
+
+def test_fetch_api_data():
+    """Test fetching data through a provided session."""
+    mock_session = Mock()
+    mock_session.get.return_value.content = b'[{"userId": 1, "title": "Post"}]'
+
+    data = fetch_api_data("https://api.example.com", 10, Mock(), mock_session)
+
+    assert data == [{"userId": 1, "title": "Post"}]
+    mock_session.get.assert_called_once()
+
+
+def test_fetch_api_data_closes_temporary_session(monkeypatch):
+    """Test that a session created for a single call is closed afterwards."""
+    mock_session = Mock()
+    mock_session.__enter__ = Mock(return_value=mock_session)
+    mock_session.__exit__ = Mock(return_value=False)
+    mock_session.get.return_value.content = b"[]"
+    monkeypatch.setattr("py_simple.main.create_session", lambda: mock_session)
+
+    assert fetch_api_data("https://api.example.com", 10, Mock()) == []
+    mock_session.__exit__.assert_called_once()
+
+
+def test_fetch_api_data_invalid_json():
+    """Test that unparseable responses are logged and re-raised."""
+    mock_session = Mock()
+    mock_session.get.return_value.content = b"not json"
+    mock_logger = Mock()
+
+    with pytest.raises(json.JSONDecodeError):
+        fetch_api_data("https://api.example.com", 10, mock_logger, mock_session)
+
+    mock_logger.error.assert_called_once()
+
+
+def test_fetch_api_data_request_error():
+    """Test that request failures are logged and re-raised."""
+    mock_session = Mock()
+    mock_session.get.side_effect = requests.exceptions.ConnectionError("down")
+    mock_logger = Mock()
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fetch_api_data("https://api.example.com", 10, mock_logger, mock_session)
+
+    mock_logger.error.assert_called_once()
+
+
+def test_save_data(tmp_path):
+    """Test that raw items and summary are written with a shared timestamp."""
+    now = datetime(2024, 1, 2, 3, 4, 5)
+    items = [{"userId": 1, "id": 1, "title": "Test post"}]
+    processed = process_data(items, Mock(), now)
+
+    save_data(
+        processed,
+        tmp_path,
+        "test_raw_{timestamp}.json",
+        "test_summary_{timestamp}.json",
+        Mock(),
+        now,
+    )
+
+    raw_file = tmp_path / "test_raw_20240102_030405.json"
+    summary_file = tmp_path / "test_summary_20240102_030405.json"
+    raw_text = raw_file.read_text(encoding="utf-8")
+    assert json.loads(raw_text) == items
+    assert "\n" not in raw_text
+
+    summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    assert "items" not in summary
+    assert summary["processed_at"] == now.isoformat()
+    assert summary["total_items"] == 1